@@ -36,19 +36,26 @@ This project was developed with assistance from AI (GitHub Copilot CLI).
 
 import argparse
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
 import csv
+import hashlib
+import json
+import math
 import sys
 import time
 import re
 import os
-from typing import List, Dict, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Sized, Tuple, Union
 from pathlib import Path
 
 import yt_dlp
-from mutagen.easyid3 import EasyID3
-from mutagen.id3 import ID3, TIT2, TPE1, TALB
-from mutagen.mp3 import MP3
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, DownloadColumn, TimeRemainingColumn
@@ -98,12 +105,251 @@ ALL_CHANNELS = [
     'radioeins', 'rock-antenne', 'rockland-radio', 'rsh', 'rt1', 'star-fm', 'sunshine-live',
     'swr1', 'swr2', 'swr3', 'swr4', 'wdr2', 'wdr3', 'wdr4', 'wdr5', 'you-fm',
 ]
+_ALL_CHANNELS_SET = frozenset(ALL_CHANNELS)
+
+# Characters not allowed in filenames: / \ : * ? " < > |
+_INVALID_TRANS = str.maketrans('', '', '<>:"/\\|?*')
+_MULTISPACE_RE = re.compile(r'\s+')
+
+# Output paths handed out to downloads in this run (as exact str(path) values),
+# so parallel downloads of songs with the same name don't pick the same file
+_claimed_paths: Set[str] = set()
+# Claimed paths whose downloads haven't finished yet
+_pending_paths: Set[str] = set()
+# Guards both sets; notified whenever a pending download finishes
+_claim_lock = threading.Condition()
+
+# Parallel downloads each run an ffmpeg conversion, so don't default to more
+# workers than there are CPU cores
+DEFAULT_DOWNLOAD_WORKERS = min(4, os.cpu_count() or 1)
+
+# YoutubeDL instances reused across songs, one per (thread, format, quality),
+# since setting one up is much more work than changing its output template
+_downloaders: Dict[Tuple[int, str, str], yt_dlp.YoutubeDL] = {}
+_downloaders_lock = threading.Lock()
+
+PLAYLIST_URL = "https://myonlineradio.de/{}/playlist"
+# Spacing between playlist requests in seconds (--interval can't go below the minimum)
+DEFAULT_REQUEST_INTERVAL = 1.0
+MIN_REQUEST_INTERVAL = 0.25
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Static parts of the playlist AJAX request (only hash and lastId change per page)
+_AJAX_FORM = {
+    "ajax": "1",
+    "name": "",
+    "from": "",
+    "to": "",
+    "actPage": "1",
+}
+# Accept-Encoding is left to requests: it advertises br as well as gzip/deflate
+# whenever brotli is installed, and only then can it decode the response
+_AJAX_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "application/json, text/javascript, */*; q=0.01",
+    "Accept-Language": "de-DE,de;q=0.7",
+    "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+    "X-Requested-With": "XMLHttpRequest",
+}
+
+
+
+class Track(NamedTuple):
+    """A scraped playlist entry (field order is the CSV column order)"""
+    timestamp: str
+    artist: str
+    song: str
+    youtube_id: str
+    data_id: str
+
+
+# Columns of the playlist CSV files
+CSV_FIELDS = list(Track._fields)
+# Rows are flushed to disk in large chunks rather than every 8 KiB
+CSV_BUFFER_SIZE = 1 << 20
+
+# Precompiled XPath queries for the playlist HTML
+_ITEMS_XPATH = etree.XPath("//*[@data-youtube]")
+_HASH_XPATH = etree.XPath("string((//select[@name='hash'])[1]/descendant::option[1]/@value)")
+
+# Locates the hash <select> in the full playlist page so only that snippet is parsed
+_HASH_SELECT_RE = re.compile(rb"<select\b[^>]*(?<![\w-])name=[\"']?hash[\"'\s>].*?</select>", re.DOTALL)
+
+
+class RateLimiter:
+    """
+    Pace requests to the playlist server.
+
+    Requests are spaced at least `interval` seconds apart, measured from the
+    start of the previous request, so time spent waiting for the server
+    counts towards the delay. The interval doubles whenever the server
+    answers 429 Too Many Requests and eases back to the base interval after
+    successful requests.
+    """
+
+    def __init__(self, interval: float = 1.0, max_interval: float = 30.0):
+        self.base_interval = interval
+        self.interval = interval
+        self.max_interval = max_interval
+        self._next_request = 0.0
+
+    def wait(self) -> None:
+        """Block until the next request is allowed"""
+        now = time.monotonic()
+        if self._next_request > now:
+            time.sleep(self._next_request - now)
+            now = self._next_request
+        self._next_request = now + self.interval
+
+    def throttle(self, retry_after: Optional[float] = None) -> None:
+        """Slow down after the server signalled rate limiting"""
+        self.interval = min(self.max_interval, max(self.interval * 2, 1.0))
+        # Honour Retry-After, but never wait longer than max_interval
+        if retry_after is None or not math.isfinite(retry_after):
+            retry_after = 0.0
+        retry_after = min(retry_after, self.max_interval)
+        self._next_request = time.monotonic() + max(self.interval, retry_after)
+
+    def relax(self) -> None:
+        """Speed back up towards the base interval after a successful request"""
+        self.interval = max(self.base_interval, self.interval / 2)
+
+
+def create_session() -> requests.Session:
+    """
+    Create a requests session with a keep-alive connection pool and retries.
+
+    The playlist endpoint is a POST, so it is explicitly allowed to be retried
+    on transient server errors. 429 responses are left to RateLimiter.
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=frozenset({"GET", "POST"}),
+    )
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=None)
+def _ajax_headers(channel: str) -> Dict[str, str]:
+    """Build the playlist AJAX headers for a channel once and reuse them"""
+    return {**_AJAX_HEADERS, "Referer": PLAYLIST_URL.format(channel)}
+
+
+def extract_hash(page: bytes) -> str:
+    """
+    Extract the playlist hash from the full playlist page.
+    
+    Only the <select name="hash"> element is handed to the HTML parser; the
+    whole page is parsed only if that element can't be located or yields no
+    hash.
+    
+    Args:
+        page: Raw HTML of the playlist page
+        
+    Returns:
+        Value of the first hash option, or an empty string
+    """
+    if not page.strip():
+        return ""
+    try:
+        match = _HASH_SELECT_RE.search(page)
+        if match:
+            hash_val = _HASH_XPATH(lxml.html.fromstring(match.group(0)))
+            if hash_val:
+                return hash_val
+        return _HASH_XPATH(lxml.html.fromstring(page))
+    except etree.ParserError:
+        # Non-blank page without any elements (e.g. only a comment)
+        return ""
+
+
+def create_progress() -> Progress:
+    """
+    Create the progress bar used for scraping and downloading.
+    
+    Redraws are capped at 4 per second; the bar state is still updated on
+    every call, but rendering (and markup parsing) happens far less often.
+    """
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        console=console,
+        refresh_per_second=4
+    )
+
+
+def _text(element) -> str:
+    """Text of an element with each text node stripped and joined, like bs4's get_text(strip=True)"""
+    return "".join(text.strip() for text in element.itertext())
+
+
+def parse_playlist_html(html) -> List[Track]:
+    """
+    Extract tracks from a playlist HTML fragment.
+    
+    Items with an empty data-youtube are kept on purpose: they belong in the
+    all-songs CSV, and the page's last item provides the lastId cursor.
+    
+    Args:
+        html: Playlist HTML as str or bytes
+        
+    Returns:
+        List of tracks in page order
+    """
+    if not html.strip():
+        return []
+    try:
+        root = lxml.html.fromstring(html)
+    except etree.ParserError:
+        # Non-blank fragment without any elements (e.g. only a comment)
+        return []
+    
+    results = []
+    for item in _ITEMS_XPATH(root):
+        youtube_id = item.get("data-youtube", "").strip('"')
+        data_id = item.get("data-id", "").strip('"')
+
+        # Extract artist, song name and timestamp in a single pass over the
+        # item's spans (first match wins for each field)
+        artist = song = timestamp = None
+        for span in item.iterdescendants("span"):
+            itemprop = span.get("itemprop")
+            if itemprop == "byArtist" and artist is None:
+                artist = _text(span)
+            elif itemprop == "name" and song is None:
+                song = _text(span)
+            
+            if timestamp is None:
+                classes = span.get("class", "").split()
+                if "txt2" in classes and "mcolumn" in classes:
+                    timestamp = _text(span)
+            
+            if artist is not None and song is not None and timestamp is not None:
+                break
+        artist = artist or ""
+        song = song or ""
+        timestamp = timestamp or ""
+
+        if artist or song:  # Only add if we found at least artist or song
+            results.append(Track(timestamp, artist, song, youtube_id, data_id))
+    return results
 
 
 def scrape_playlist(
     session: requests.Session, channel: str = 'swr4', act_page: int = 1, 
-    last_id: str = "", hash_val: str = "", progress: Optional[Progress] = None, task_id: Optional[int] = None
-) -> List[Dict[str, str]]:
+    last_id: str = "", hash_val: str = "", progress: Optional[Progress] = None, task_id: Optional[int] = None,
+    limiter: Optional[RateLimiter] = None
+) -> List[Track]:
     """
     Scrape playlist data from myonlineradio.de
 
@@ -115,74 +361,49 @@ def scrape_playlist(
         hash_val: Hash value extracted from the playlist page (required by the API)
         progress: Optional rich Progress instance
         task_id: Optional task ID for progress tracking
+        limiter: Optional rate limiter to pace requests and back off on 429
 
     Returns:
-        List of dictionaries containing artist, song, youtube_id, timestamp, and data_id
-    """
-    url = f"https://myonlineradio.de/{channel}/playlist"
-    data = {
-        "ajax": "1",
-        "name": "",
-        "from": "",
-        "to": "",
-        "hash": hash_val,
-        "actPage": "1",
-        "lastId": last_id,
-    }
-
-    headers = {
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "application/json, text/javascript, */*; q=0.01",
-        "Accept-Language": "de-DE,de;q=0.7",
-        "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-        "Referer": f"https://myonlineradio.de/{channel}/playlist",
-        "X-Requested-With": "XMLHttpRequest",
-    }
+        List of tracks containing timestamp, artist, song, youtube_id, and data_id
+    """
+    url = PLAYLIST_URL.format(channel)
+    data = {**_AJAX_FORM, "hash": hash_val, "lastId": last_id}
 
     try:
         if progress and task_id is not None:
             progress.update(task_id, description=f"[cyan]Scraping page {act_page}...")
         
-        response = session.post(url, data=data, headers=headers, timeout=30)
+        if limiter:
+            limiter.wait()
+        response = session.post(url, data=data, headers=_ajax_headers(channel), timeout=30)
+
+        # Back off and retry while the server asks us to slow down
+        retries = 0
+        while limiter and response.status_code == 429 and retries < 3:
+            try:
+                retry_after = float(response.headers.get("Retry-After", ""))
+            except ValueError:
+                retry_after = None
+            if retry_after is not None and not math.isfinite(retry_after):
+                retry_after = None
+            limiter.throttle(retry_after)
+            limiter.wait()
+            response = session.post(url, data=data, headers=_ajax_headers(channel), timeout=30)
+            retries += 1
+
         response.raise_for_status()
+        if limiter:
+            limiter.relax()
 
-        # Response is JSON with an 'html' key containing the playlist HTML
+        # Response is JSON with an 'html' key containing the playlist HTML.
+        # Decode straight from the raw bytes so requests never has to guess
+        # the text encoding.
         try:
-            html = response.json().get('html', '')
+            html = json.loads(response.content).get('html', '')
         except Exception:
-            html = response.text
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Find all playlist items with data-youtube attribute
-        playlist_items = soup.find_all(attrs={"data-youtube": True})
-
-        results = []
-        for item in playlist_items:
-            youtube_id = item.get("data-youtube", "").strip('"')
-            data_id = item.get("data-id", "").strip('"')
-
-            # Extract artist
-            artist_elem = item.find("span", itemprop="byArtist")
-            artist = artist_elem.get_text(strip=True) if artist_elem else ""
-
-            # Extract song name
-            song_elem = item.find("span", itemprop="name")
-            song = song_elem.get_text(strip=True) if song_elem else ""
-
-            # Extract timestamp
-            time_elem = item.find("span", class_="txt2 mcolumn")
-            timestamp = time_elem.get_text(strip=True) if time_elem else ""
-
-            if artist or song:  # Only add if we found at least artist or song
-                results.append(
-                    {
-                        "timestamp": timestamp,
-                        "artist": artist,
-                        "song": song,
-                        "youtube_id": youtube_id,
-                        "data_id": data_id,
-                    }
-                )
+            html = response.content
+
+        results = parse_playlist_html(html)
 
         if progress and task_id is not None:
             progress.update(task_id, advance=1, description=f"[green]✓ Page {act_page} ({len(results)} tracks)")
@@ -196,47 +417,192 @@ def scrape_playlist(
         return []
 
 
-def filter_unique_songs(data: List[Dict[str, str]]) -> List[Dict[str, str]]:
+class BloomFilter:
+    """
+    Approximate set of strings in a fixed-size bit array. Membership tests can
+    return false positives (at roughly error_rate once `capacity` items have
+    been added) but never false negatives, and memory use doesn't depend on
+    the length of the keys.
+    """
+    
+    def __init__(self, capacity: int, error_rate: float = 1e-6):
+        capacity = max(1, capacity)
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+    
+    def _positions(self, key: str):
+        # Double hashing: derive all bit positions from one 128-bit digest
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+    
+    def add(self, key: str) -> bool:
+        """Add a key; returns False if it was (probably) already present"""
+        added = False
+        for pos in self._positions(key):
+            mask = 1 << (pos & 7)
+            if not self._bits[pos >> 3] & mask:
+                self._bits[pos >> 3] |= mask
+                added = True
+        return added
+    
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+def filter_unique_songs(data: Iterable[Dict[str, str]], approximate: bool = False,
+                        capacity: Optional[int] = None) -> Iterator[Dict[str, str]]:
     """
     Filter songs to keep only unique entries based on youtube_id.
-    Keeps the first occurrence of each unique youtube_id.
+    Keeps the first occurrence of each unique youtube_id. Songs are yielded
+    as they are read, so only the seen ids are held in memory.
     
     Args:
-        data: List of song dictionaries
+        data: Song dictionaries (a list or any iterable, consumed once)
+        approximate: Track seen ids in a Bloom filter instead of a set. Uses
+            far less memory on huge inputs, but about one in a million unique
+            songs may be dropped as a false duplicate.
+        capacity: Expected number of songs for the Bloom filter (defaults to
+            len(data), or 100,000 if data has no length)
         
-    Returns:
-        List of unique songs
+    Yields:
+        Unique songs in input order
     """
-    seen_ids = set()
-    unique_songs = []
+    seen: Union[Set[str], BloomFilter]
+    if approximate:
+        if capacity is None:
+            capacity = len(data) if isinstance(data, Sized) else 100_000
+        seen = BloomFilter(capacity)
+    else:
+        seen = set()
     
     for song in data:
         youtube_id = song.get('youtube_id')
+        if youtube_id and youtube_id not in seen:
+            seen.add(youtube_id)
+            yield song
+
+
+def collect_songs(page_data: List[Track], seen_ids: Union[Set[str], BloomFilter]) -> List[Track]:
+    """
+    Deduplicate a page of scraped tracks by youtube_id as they arrive.
+    Keeps the first occurrence of each unique youtube_id, so no second pass
+    over all songs is needed.
+    
+    Args:
+        page_data: Tracks scraped from one page
+        seen_ids: youtube_ids seen so far (a set, or a BloomFilter for
+            approximate dedup), updated in place
+        
+    Returns:
+        Tracks from this page that were not seen before
+    """
+    new_songs = []
+    
+    for song in page_data:
+        youtube_id = song.youtube_id
         if youtube_id and youtube_id not in seen_ids:
             seen_ids.add(youtube_id)
-            unique_songs.append(song)
+            new_songs.append(song)
     
-    return unique_songs
-
+    return new_songs
 
-def save_to_csv(data: List[Dict[str, str]], filename: str = "swr4_playlist.csv") -> bool:
-    """Save scraped data to CSV file"""
-    if not data:
-        console.print("[yellow]No data to save[/yellow]")
-        return False
 
-    try:
-        with open(filename, "w", newline="", encoding="utf-8") as f:
-            fieldnames = ["timestamp", "artist", "song", "youtube_id", "data_id"]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+class CsvStream:
+    """
+    Write tracks to a CSV file while scraping, so rows don't have to be kept
+    in memory until the end. The file is only created once the first row
+    arrives; write errors are reported once and further rows are dropped.
+    """
+    
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.count = 0
+        self.failed = False
+        self._file = None
+        self._writer = None
+    
+    def write(self, rows: List[Track]) -> None:
+        """Append rows to the file, creating it with a header on first use"""
+        if not rows or self.failed:
+            return
+        
+        try:
+            if self._writer is None:
+                self._file = open(self.filename, "w", newline="", encoding="utf-8",
+                                  buffering=CSV_BUFFER_SIZE)
+                self._writer = csv.writer(self._file)
+                self._writer.writerow(CSV_FIELDS)
+            self._writer.writerows(rows)
+            self.count += len(rows)
+        except Exception as e:
+            console.print(f"[red]Error saving to {self.filename}: {e}[/red]")
+            self.failed = True
+            self.close()
+    
+    def close(self) -> None:
+        """Flush and close the file (safe to call more than once)"""
+        if self._file is None:
+            return
+        
+        try:
+            self._file.close()
+        except Exception as e:
+            if not self.failed:
+                console.print(f"[red]Error saving to {self.filename}: {e}[/red]")
+                self.failed = True
+        self._file = None
+    
+    @property
+    def saved(self) -> bool:
+        """Whether any rows were written successfully"""
+        return self.count > 0 and not self.failed
 
-            writer.writeheader()
-            writer.writerows(data)
 
-        return True
-    except Exception as e:
-        console.print(f"[red]Error saving to {filename}: {e}[/red]")
-        return False
+class ScrapeResults:
+    """
+    Running results of a live scrape. Every page goes through add_page(),
+    which trims it to the song limit, deduplicates it, writes it to the open
+    CSV streams and updates the counters used by the summary.
+    """
+    
+    def __init__(self, seen_ids: Union[Set[str], BloomFilter],
+                 all_stream: Optional[CsvStream] = None, unique_stream: Optional[CsvStream] = None,
+                 max_songs: Optional[int] = None, keep_unique: bool = False):
+        self.seen_ids = seen_ids
+        self.all_stream = all_stream
+        self.unique_stream = unique_stream
+        self.max_songs = max_songs
+        self.keep_unique = keep_unique
+        self.unique_data: List[Track] = []  # Only kept when keep_unique is set
+        self.sample_tracks: List[Track] = []  # First 5 unique songs for the summary
+        self.total_songs = 0
+        self.unique_count = 0
+    
+    @property
+    def limit_reached(self) -> bool:
+        """Whether --max-songs songs have been collected"""
+        return bool(self.max_songs) and self.total_songs >= self.max_songs
+    
+    def add_page(self, page_data: List[Track]) -> List[Track]:
+        """Record one scraped page; returns the page trimmed to the song limit"""
+        # Stop at the song limit instead of trimming afterwards
+        if self.max_songs:
+            page_data = page_data[:self.max_songs - self.total_songs]
+        
+        new_songs = collect_songs(page_data, self.seen_ids)
+        if self.all_stream:
+            self.all_stream.write(page_data)
+        if self.unique_stream:
+            self.unique_stream.write(new_songs)
+        if self.keep_unique:
+            self.unique_data.extend(new_songs)
+        self.sample_tracks.extend(new_songs[:5 - len(self.sample_tracks)])
+        self.unique_count += len(new_songs)
+        self.total_songs += len(page_data)
+        return page_data
 
 
 def list_channels():
@@ -273,7 +639,7 @@ def list_channels():
 
 def validate_channel(channel: str) -> bool:
     """Check if a channel is valid"""
-    return channel.lower() in ALL_CHANNELS
+    return channel.lower() in _ALL_CHANNELS_SET
 
 
 def sanitize_filename(filename: str) -> str:
@@ -286,12 +652,11 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename safe for filesystem
     """
-    # Remove invalid characters: / \ : * ? " < > |
-    invalid_chars = r'[<>:"/\\|?*]'
-    sanitized = re.sub(invalid_chars, '', filename)
+    # Remove invalid characters
+    sanitized = filename.translate(_INVALID_TRANS)
     
     # Replace multiple spaces with single space
-    sanitized = re.sub(r'\s+', ' ', sanitized)
+    sanitized = _MULTISPACE_RE.sub(' ', sanitized)
     
     # Trim whitespace and dots from ends
     sanitized = sanitized.strip(' .')
@@ -303,7 +668,8 @@ def sanitize_filename(filename: str) -> str:
     return sanitized if sanitized else 'untitled'
 
 
-def get_unique_filename(directory: Path, base_name: str, extension: str) -> Path:
+def get_unique_filename(directory: Path, base_name: str, extension: str,
+                        reserved: Optional[Set[str]] = None) -> Path:
     """
     Get a unique filename by appending numbers if file exists.
     
@@ -311,26 +677,88 @@ def get_unique_filename(directory: Path, base_name: str, extension: str) -> Path
         directory: Target directory
         base_name: Base filename without extension
         extension: File extension (e.g., '.mp3')
+        reserved: Optional str() values of paths to treat as taken even if
+            they don't exist yet
         
     Returns:
         Unique file path
     """
+    reserved = reserved or set()
     filename = directory / f"{base_name}{extension}"
     
-    if not filename.exists():
+    if str(filename) not in reserved and not filename.exists():
         return filename
     
-    # File exists, append number
+    # File exists: list the directory once instead of stat-ing every candidate
+    try:
+        with os.scandir(directory) as entries:
+            existing = {entry.name.casefold() for entry in entries}
+    except FileNotFoundError:
+        existing = set()
+    
     counter = 1
     while True:
-        filename = directory / f"{base_name} ({counter}){extension}"
-        if not filename.exists():
+        candidate = f"{base_name} ({counter}){extension}"
+        filename = directory / candidate
+        # Listed names are compared case-insensitively to stay clear of
+        # near-collisions; exists() then confirms the pick against the
+        # filesystem's own rules
+        if (candidate.casefold() not in existing and str(filename) not in reserved
+                and not filename.exists()):
             return filename
         counter += 1
         if counter > 1000:  # Safety limit
             raise Exception("Too many duplicate filenames")
 
 
+def _get_downloader(format_choice: str, quality: str) -> yt_dlp.YoutubeDL:
+    """Return the calling thread's YoutubeDL for a format, creating it on first use"""
+    key = (threading.get_ident(), format_choice, quality)
+    with _downloaders_lock:
+        ydl = _downloaders.get(key)
+    if ydl is not None:
+        return ydl
+    
+    ydl_opts = {
+        'format': 'bestaudio/best',
+        'quiet': True,
+        'no_warnings': True,
+        'socket_timeout': 30,
+    }
+    
+    # Add format-specific options
+    if format_choice in ['mp3', 'm4a']:
+        ydl_opts['postprocessors'] = [{
+            'key': 'FFmpegExtractAudio',
+            'preferredcodec': format_choice,
+            'preferredquality': quality if quality != 'best' else '0',
+        }]
+    
+    ydl = yt_dlp.YoutubeDL(ydl_opts)
+    with _downloaders_lock:
+        _downloaders[key] = ydl
+    return ydl
+
+
+def close_downloaders() -> None:
+    """Close the YoutubeDL instances cached by download_youtube_audio()"""
+    with _downloaders_lock:
+        downloaders = list(_downloaders.values())
+        _downloaders.clear()
+    for ydl in downloaders:
+        ydl.close()
+
+
+def _settle_path(path: Path, succeeded: bool) -> None:
+    """Mark a claimed output path as finished; a failed download gives the name up again"""
+    key = str(path)
+    with _claim_lock:
+        _pending_paths.discard(key)
+        if not succeeded:
+            _claimed_paths.discard(key)
+        _claim_lock.notify_all()
+
+
 def download_youtube_audio(
     youtube_id: str,
     artist: str,
@@ -381,64 +809,51 @@ def download_youtube_audio(
         ext_map = {'mp3': '.mp3', 'm4a': '.m4a', 'mp4': '.mp4'}
         extension = ext_map.get(format_choice, '.mp3')
         
-        # Skip if file already exists and redownload is not requested
-        if not redownload and (download_dir / (base_filename + extension)).exists():
+        # Pick the output file under a lock, since downloads may run in parallel
+        with _claim_lock:
+            # Skip if file already exists (or was downloaded) and redownload is not requested
+            target = download_dir / (base_filename + extension)
+            target_key = str(target)
+            if not redownload:
+                # A song with the same name is still downloading: wait for it, so
+                # this one is only skipped if that download actually succeeds
+                _claim_lock.wait_for(lambda: target_key not in _pending_paths)
+            skip = not redownload and (target_key in _claimed_paths or target.exists())
+            if not skip:
+                # Get unique filename
+                output_path = get_unique_filename(download_dir, base_filename, extension, _claimed_paths)
+                output_key = str(output_path)
+                _claimed_paths.add(output_key)
+                _pending_paths.add(output_key)
+        
+        if skip:
             if progress and task_id is not None:
                 progress.update(task_id, advance=1)
             return True, f"Skipped (already exists): {base_filename}"
         
-        # Get unique filename
-        output_path = get_unique_filename(download_dir, base_filename, extension)
-        
-        # Configure yt-dlp options
-        ydl_opts = {
-            'format': 'bestaudio/best',
-            'outtmpl': str(output_path.with_suffix('')),  # yt-dlp adds extension
-            'quiet': True,
-            'no_warnings': True,
-            'socket_timeout': 30,
-        }
-        
-        # Add format-specific options
-        if format_choice in ['mp3', 'm4a']:
-            ydl_opts['postprocessors'] = [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': format_choice,
-                'preferredquality': quality if quality != 'best' else '0',
-            }]
-        
-        # Download
-        url = f"https://www.youtube.com/watch?v={youtube_id}"
-        
-        if progress and task_id is not None:
-            progress.update(task_id, description=f"[cyan]Downloading: {base_filename[:40]}...")
-        
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        succeeded = False
+        try:
+            # Download
+            url = f"https://www.youtube.com/watch?v={youtube_id}"
+            
+            if progress and task_id is not None:
+                progress.update(task_id, description=f"[cyan]Downloading: {base_filename[:40]}...")
+            
+            # Tag MP3s while ffmpeg converts the audio, instead of rewriting the
+            # file afterwards (ffmpeg maps these to ID3 TPE1/TIT2/TALB)
+            tags = []
+            if add_metadata and format_choice == 'mp3':
+                for key, value in (('artist', artist), ('title', song), ('album', channel.upper())):
+                    if value:
+                        tags += ['-metadata', f'{key}={value}']
+            
+            ydl = _get_downloader(format_choice, quality)
+            ydl.params['outtmpl']['default'] = str(output_path.with_suffix(''))  # yt-dlp adds extension
+            ydl.params['postprocessor_args'] = {'extractaudio+ffmpeg_o': tags}
             ydl.download([url])
-        
-        # Add metadata if requested and format is MP3
-        if add_metadata and format_choice == 'mp3' and output_path.exists():
-            try:
-                audio = MP3(str(output_path), ID3=ID3)
-                
-                # Add ID3 tag if it doesn't exist
-                try:
-                    audio.add_tags()
-                except:
-                    pass
-                
-                # Set tags
-                if artist:
-                    audio['TPE1'] = TPE1(encoding=3, text=artist)
-                if song:
-                    audio['TIT2'] = TIT2(encoding=3, text=song)
-                if channel:
-                    audio['TALB'] = TALB(encoding=3, text=channel.upper())
-                
-                audio.save()
-            except Exception as e:
-                # Metadata failed but download succeeded
-                console.print(f"[yellow]⚠ Metadata error for {base_filename[:30]}: {str(e)[:50]}[/yellow]")
+            succeeded = True
+        finally:
+            _settle_path(output_path, succeeded)
         
         if progress and task_id is not None:
             progress.update(task_id, advance=1)
@@ -458,24 +873,106 @@ def download_youtube_audio(
         return False, f"✗ Failed: {base_filename[:40]} ({str(e)[:30]})"
 
 
-def load_songs_from_csv(csv_path: str) -> List[Dict[str, str]]:
+def download_all(
+    songs: List[Tuple[str, str, str, str]],
+    download_dir: Path,
+    format_choice: str,
+    quality: str,
+    add_metadata: bool,
+    redownload: bool,
+    concurrency: int,
+    quiet: bool = False
+) -> Tuple[int, int]:
     """
-    Load song data from CSV file.
+    Download songs in parallel with download_youtube_audio().
     
     Args:
-        csv_path: Path to CSV file
+        songs: (youtube_id, artist, song, channel) for each song
+        download_dir: Download directory
+        format_choice: Output format (mp3, m4a, mp4)
+        quality: Audio quality (128, 192, 320, best)
+        add_metadata: Whether to embed ID3 tags
+        redownload: Re-download files that already exist
+        concurrency: Number of downloads to run at once
+        quiet: No progress bar and no per-song failure messages
         
     Returns:
-        List of song dictionaries
+        Tuple of (successful, failed) counts
     """
+    successful = 0
+    failed = 0
+    
     try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            songs = list(reader)
-            return songs
-    except Exception as e:
-        console.print(f"[red]Error loading CSV: {e}[/red]")
-        return []
+        with (nullcontext() if quiet else create_progress()) as progress:
+            task_id = None
+            if progress is not None:
+                task_id = progress.add_task(f"[cyan]Downloading {format_choice.upper()}...", total=len(songs))
+            
+            # Options shared by every song, built once
+            common = dict(
+                download_dir=download_dir,
+                format_choice=format_choice,
+                quality=quality,
+                add_metadata=add_metadata,
+                redownload=redownload,
+                progress=progress,
+                task_id=task_id
+            )
+            
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = [
+                    executor.submit(download_youtube_audio, youtube_id, artist, song, channel, **common)
+                    for youtube_id, artist, song, channel in songs
+                ]
+                
+                try:
+                    for future in as_completed(futures):
+                        success, msg = future.result()
+                        
+                        if success:
+                            successful += 1
+                        else:
+                            failed += 1
+                            if not quiet:
+                                console.print(f"[yellow]{msg}[/yellow]")
+                except BaseException:
+                    # Don't start queued downloads after an error or Ctrl+C
+                    for future in futures:
+                        future.cancel()
+                    raise
+    finally:
+        # The executor has waited for running downloads by now, even after an
+        # error or Ctrl+C, so the cached YoutubeDL instances are free to close
+        close_downloaders()
+        # Names only need to be reserved while their downloads are running
+        with _claim_lock:
+            _claimed_paths.clear()
+            _pending_paths.clear()
+    
+    return successful, failed
+
+
+class CsvSongReader:
+    """
+    Read song rows from a CSV file lazily, counting them as they are read.
+    A read error is reported once and ends the iteration; `failed` tells the
+    caller that the file wasn't read completely.
+    """
+    
+    def __init__(self, csv_path: str):
+        self.csv_path = csv_path
+        self.count = 0
+        self.failed = False
+    
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        try:
+            with open(self.csv_path, 'r', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    self.count += 1
+                    yield row
+        except Exception as e:
+            console.print(f"[red]Error loading CSV: {e}[/red]")
+            self.failed = True
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -507,6 +1004,9 @@ Popular channels: 1live, antenne-bayern, bayern-3, bigfm, ndr-2, swr3, wdr2
                         help='Output filename (default: {channel}_playlist.csv)')
     parser.add_argument('--start-id', type=str, default='',
                         help='Starting lastId parameter (optional)')
+    parser.add_argument('--interval', type=float, default=DEFAULT_REQUEST_INTERVAL, metavar='SECONDS',
+                        help=f'Minimum delay between page requests (default: {DEFAULT_REQUEST_INTERVAL:g}, '
+                             f'minimum: {MIN_REQUEST_INTERVAL:g})')
     
     # Output mode options (mutually exclusive group)
     output_group = parser.add_mutually_exclusive_group()
@@ -519,6 +1019,10 @@ Popular channels: 1live, antenne-bayern, bayern-3, bigfm, ndr-2, swr3, wdr2
                         help='Minimal output mode (no progress bars)')
     parser.add_argument('--no-color', action='store_true',
                         help='Disable colored output')
+    parser.add_argument('--approximate-dedup', action='store_true',
+                        help='Track seen song ids in a Bloom filter instead of a set '
+                             '(smaller id index; unique songs queued for download are '
+                             'still kept; ~1e-6 chance of dropping a unique song)')
     parser.add_argument('-i', '--interactive', action='store_true',
                         help='Interactive mode with guided prompts')
     
@@ -537,8 +1041,16 @@ Popular channels: 1live, antenne-bayern, bayern-3, bigfm, ndr-2, swr3, wdr2
                         help="Re-download files that already exist (default: skip existing)")
     parser.add_argument('--no-metadata', action='store_true',
                         help='Skip ID3 metadata embedding (faster)')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_DOWNLOAD_WORKERS, metavar='N',
+                        help='Number of songs to download in parallel '
+                             f'(default: min(4, CPU cores), here {DEFAULT_DOWNLOAD_WORKERS})')
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    if not math.isfinite(args.interval) or args.interval < MIN_REQUEST_INTERVAL:
+        parser.error(f"--interval must be a number of seconds, at least {MIN_REQUEST_INTERVAL:g}")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    return args
 
 
 def get_interactive_config() -> dict:
@@ -637,7 +1149,7 @@ def get_interactive_config() -> dict:
     }
 
 
-def display_summary(all_data: List[Dict], unique_data: List[Dict], 
+def display_summary(total_count: int, unique_count: int, sample_tracks: List[Track],
                    saved_files: List[tuple], pages_scraped: int, channel: str):
     """Display a summary table of the scraping results"""
     table = Table(title=f"Scraping Summary - {channel.upper()}", show_header=True, header_style="bold magenta")
@@ -647,9 +1159,9 @@ def display_summary(all_data: List[Dict], unique_data: List[Dict],
     
     table.add_row("Channel", channel.upper())
     table.add_row("Pages Scraped", str(pages_scraped))
-    table.add_row("Total Songs Found", str(len(all_data)))
-    table.add_row("Unique Songs", str(len(unique_data)))
-    table.add_row("Duplicates Removed", str(len(all_data) - len(unique_data)))
+    table.add_row("Total Songs Found", str(total_count))
+    table.add_row("Unique Songs", str(unique_count))
+    table.add_row("Duplicates Removed", str(total_count - unique_count))
     
     if saved_files:
         table.add_section()
@@ -660,7 +1172,7 @@ def display_summary(all_data: List[Dict], unique_data: List[Dict],
     console.print(table)
     
     # Show sample tracks
-    if unique_data:
+    if sample_tracks:
         console.print("\n[bold cyan]Sample Tracks:[/bold cyan]")
         sample_table = Table(show_header=True, header_style="bold yellow")
         sample_table.add_column("Time", style="dim")
@@ -668,12 +1180,12 @@ def display_summary(all_data: List[Dict], unique_data: List[Dict],
         sample_table.add_column("Song", style="green")
         sample_table.add_column("YouTube ID", style="blue")
         
-        for track in unique_data[:5]:
+        for track in sample_tracks:
             sample_table.add_row(
-                track['timestamp'],
-                track['artist'][:30],
-                track['song'][:30],
-                track['youtube_id']
+                track.timestamp,
+                track.artist[:30],
+                track.song[:30],
+                track.youtube_id
             )
         
         console.print(sample_table)
@@ -719,60 +1231,46 @@ def main():
     # Handle batch download from CSV
     if args.from_csv:
         console.print(f"[cyan]Loading songs from {args.from_csv}...[/cyan]")
-        all_data = load_songs_from_csv(args.from_csv)
+        reader = CsvSongReader(args.from_csv)
+        
+        if args.download:
+            capacity = None
+            if args.approximate_dedup:
+                # Over-estimate the row count from the file size (real rows are longer)
+                try:
+                    capacity = os.path.getsize(args.from_csv) // 32
+                except OSError:
+                    pass
+            
+            # Filter unique while reading — always download unique songs only.
+            # Only the download specs are kept, not the CSV rows.
+            songs_to_download = [
+                (song.get('youtube_id', ''), song.get('artist', ''), song.get('song', ''), song.get('channel', channel))
+                for song in filter_unique_songs(reader, approximate=args.approximate_dedup, capacity=capacity)
+            ]
+        else:
+            # Nothing to download; just read the file to report its size
+            for _ in reader:
+                pass
         
-        if not all_data:
+        if reader.failed:
+            sys.exit(1)
+        if not reader.count:
             console.print("[red]No songs loaded from CSV![/red]")
             sys.exit(1)
         
-        console.print(f"[green]✓ Loaded {len(all_data)} songs from CSV[/green]")
-        
-        # Filter unique — always download unique songs only
-        unique_data = filter_unique_songs(all_data)
-        songs_to_download = unique_data
+        console.print(f"[green]✓ Loaded {reader.count} songs from CSV[/green]")
         
         # Download if requested
         if args.download:
             download_dir = Path(args.download_dir)
             
-            console.print(f"\n[bold]Fetched[/bold] [green]{len(all_data)}[/green] songs — [bold]{len(unique_data)}[/bold] unique to download → [cyan]{download_dir}/[/cyan]")
-            
-            successful = 0
-            failed = 0
+            console.print(f"\n[bold]Fetched[/bold] [green]{reader.count}[/green] songs — [bold]{len(songs_to_download)}[/bold] unique to download → [cyan]{download_dir}/[/cyan]")
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                console=console
-            ) as progress:
-                task = progress.add_task(
-                    f"[cyan]Downloading...", 
-                    total=len(songs_to_download)
-                )
-                
-                for song in songs_to_download:
-                    success, msg = download_youtube_audio(
-                        youtube_id=song.get('youtube_id', ''),
-                        artist=song.get('artist', ''),
-                        song=song.get('song', ''),
-                        channel=song.get('channel', channel),
-                        download_dir=download_dir,
-                        format_choice=args.format,
-                        quality=args.quality,
-                        add_metadata=not args.no_metadata,
-                        redownload=args.redownload,
-                        progress=progress,
-                        task_id=task
-                    )
-                    
-                    if success:
-                        successful += 1
-                    else:
-                        failed += 1
-                        if not args.quiet:
-                            console.print(f"[yellow]{msg}[/yellow]")
+            successful, failed = download_all(
+                songs_to_download, download_dir, args.format, args.quality,
+                not args.no_metadata, args.redownload, args.concurrency, quiet=args.quiet
+            )
             
             # Show download summary
             console.print(f"\n[green]✓ Download complete: {successful} successful, {failed} failed[/green]")
@@ -783,11 +1281,11 @@ def main():
     if not args.output:
         args.output = f"{channel}_playlist.csv"
     
-    all_data = []
     pages_scraped = 0
     
     # Create session and get initial cookies + hash
-    session = requests.Session()
+    session = create_session()
+    limiter = RateLimiter(args.interval)
     hash_val = ""
     
     if not args.quiet:
@@ -795,191 +1293,134 @@ def main():
         console.print("[cyan]Initializing session and getting cookies...[/cyan]")
     
     try:
+        # Paced like the page requests, so the first page follows one regular
+        # interval after this instead of a fixed pause
+        limiter.wait()
         response = session.get(
-            f"https://myonlineradio.de/{channel}/playlist",
-            headers={
-                "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            },
+            PLAYLIST_URL.format(channel),
+            headers={"User-Agent": USER_AGENT},
             timeout=30,
         )
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, "html.parser")
-            hash_select = soup.find('select', {'name': 'hash'})
-            if hash_select:
-                first_option = hash_select.find('option')
-                if first_option:
-                    hash_val = first_option.get('value', '')
+            hash_val = extract_hash(response.content)
             if not args.quiet:
                 console.print("[green]✓ Session initialized[/green]")
         elif response.status_code == 404:
             console.print(f"[red]✗ Error: Channel '{channel}' not found![/red]")
             console.print("[yellow]Use --list-channels to see available channels.[/yellow]")
             sys.exit(1)
-        time.sleep(2)
     except Exception as e:
         console.print(f"[yellow]⚠ Warning: Could not get cookies: {e}[/yellow]")
     
-    # Start scraping with progress bar
-    if args.quiet:
-        # Quiet mode - no progress bar
-        last_id = args.start_id
-        for page in range(1, args.pages + 1):
-            if args.max_songs and len(all_data) >= args.max_songs:
-                break
-            
-            page_data = scrape_playlist(session, channel=channel, act_page=page, last_id=last_id, hash_val=hash_val)
-            if not page_data:
-                break
-            
-            all_data.extend(page_data)
-            pages_scraped = page
-            
-            if page_data:
-                last_id = page_data[-1]["data_id"]
-            
-            if page < args.pages:
-                time.sleep(1)
+    # Open output files based on mode
+    all_stream = None
+    unique_stream = None
+    
+    if args.save_both:
+        # Save both all and unique
+        output = Path(args.output)
+        suffix = output.suffix or '.csv'
+        all_filename = str(output.with_name(f"{output.stem}_all{suffix}"))
+        unique_filename = str(output.with_name(f"{output.stem}_unique{suffix}"))
+        all_stream = CsvStream(all_filename)
+        unique_stream = CsvStream(unique_filename)
+    elif args.unique_only:
+        # Save only unique
+        unique_stream = CsvStream(args.output)
     else:
-        # Rich progress bar mode
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console
-        ) as progress:
-            task = progress.add_task(f"[cyan]Scraping {channel.upper()} pages...", total=args.pages)
-            
+        # Save all (default)
+        all_stream = CsvStream(args.output)
+    
+    # Songs are deduplicated and written to CSV while scraping; only their
+    # youtube_ids (plus the unique songs when downloading) are kept in memory
+    seen_ids: Union[Set[str], BloomFilter]
+    if args.approximate_dedup:
+        # Sized generously: a playlist page holds well under 100 tracks
+        seen_ids = BloomFilter(args.max_songs or args.pages * 100)
+    else:
+        seen_ids = set()
+    results = ScrapeResults(seen_ids, all_stream, unique_stream,
+                            max_songs=args.max_songs, keep_unique=args.download)
+    
+    try:
+        # Start scraping with progress bar. Pages are chained through lastId (each
+        # request needs the last data-id of the previous page), so they can't be
+        # fetched concurrently.
+        if args.quiet:
+            # Quiet mode - no progress bar
             last_id = args.start_id
             for page in range(1, args.pages + 1):
-                # Check if we've hit the song limit
-                if args.max_songs and len(all_data) >= args.max_songs:
-                    progress.update(task, description=f"[yellow]✓ Reached max songs limit ({args.max_songs})")
+                if results.limit_reached:
                     break
                 
                 page_data = scrape_playlist(session, channel=channel, act_page=page, last_id=last_id, hash_val=hash_val,
-                                           progress=progress, task_id=task)
+                                            limiter=limiter)
                 if not page_data:
-                    progress.update(task, description=f"[yellow]✓ No more data at page {page}")
                     break
                 
-                all_data.extend(page_data)
+                page_data = results.add_page(page_data)
                 pages_scraped = page
+                last_id = page_data[-1].data_id
+        else:
+            # Rich progress bar mode
+            with create_progress() as progress:
+                task = progress.add_task(f"[cyan]Scraping {channel.upper()} pages...", total=args.pages)
                 
-                # Update last_id for next page
-                if page_data:
-                    last_id = page_data[-1]["data_id"]
+                last_id = args.start_id
+                for page in range(1, args.pages + 1):
+                    # Check if we've hit the song limit
+                    if results.limit_reached:
+                        progress.update(task, description=f"[yellow]✓ Reached max songs limit ({args.max_songs})")
+                        break
+                    
+                    page_data = scrape_playlist(session, channel=channel, act_page=page, last_id=last_id, hash_val=hash_val,
+                                               progress=progress, task_id=task, limiter=limiter)
+                    if not page_data:
+                        progress.update(task, description=f"[yellow]✓ No more data at page {page}")
+                        break
+                    
+                    page_data = results.add_page(page_data)
+                    pages_scraped = page
+                    
+                    # Update last_id for next page
+                    last_id = page_data[-1].data_id
                 
-                # Rate limiting
-                if page < args.pages and (not args.max_songs or len(all_data) < args.max_songs):
-                    time.sleep(1)
-            
-            progress.update(task, completed=pages_scraped)
+                progress.update(task, completed=pages_scraped)
+    finally:
+        for stream in (all_stream, unique_stream):
+            if stream:
+                stream.close()
     
-    # Trim to max_songs if specified
-    if args.max_songs and len(all_data) > args.max_songs:
-        all_data = all_data[:args.max_songs]
-    
-    # Filter unique songs
-    unique_data = filter_unique_songs(all_data)
-    
-    # Save files based on mode
+    # Report saved files
     saved_files = []
     
-    if args.save_both:
-        # Save both all and unique
-        all_filename = args.output.replace('.csv', '_all.csv') if '.csv' in args.output else f"{args.output}_all.csv"
-        unique_filename = args.output.replace('.csv', '_unique.csv') if '.csv' in args.output else f"{args.output}_unique.csv"
-        
-        if save_to_csv(all_data, all_filename):
-            saved_files.append((all_filename, len(all_data)))
-            console.print(f"[green]✓ Saved all songs to {all_filename}[/green]")
-        
-        if save_to_csv(unique_data, unique_filename):
-            saved_files.append((unique_filename, len(unique_data)))
-            console.print(f"[green]✓ Saved unique songs to {unique_filename}[/green]")
-    
-    elif args.unique_only:
-        # Save only unique
-        if save_to_csv(unique_data, args.output):
-            saved_files.append((args.output, len(unique_data)))
-            console.print(f"[green]✓ Saved unique songs to {args.output}[/green]")
-    
-    else:
-        # Save all (default)
-        if save_to_csv(all_data, args.output):
-            saved_files.append((args.output, len(all_data)))
-            console.print(f"[green]✓ Saved all songs to {args.output}[/green]")
+    for stream, label in ((all_stream, "all"), (unique_stream, "unique")):
+        if stream is None or stream.failed:
+            continue
+        if stream.saved:
+            saved_files.append((stream.filename, stream.count))
+            console.print(f"[green]✓ Saved {label} songs to {stream.filename}[/green]")
+        else:
+            console.print("[yellow]No data to save[/yellow]")
     
     # Download songs if requested (live mode)
     if args.download and not args.from_csv:
-        songs_to_download = unique_data
+        songs_to_download = [(song.youtube_id, song.artist, song.song, channel) for song in results.unique_data]
         
         download_dir = Path(args.download_dir)
-        console.print(f"\n[bold]Fetched[/bold] [green]{len(all_data)}[/green] songs — [bold]{len(unique_data)}[/bold] unique to download → [cyan]{download_dir}/[/cyan]")
-        
-        successful = 0
-        failed = 0
+        console.print(f"\n[bold]Fetched[/bold] [green]{results.total_songs}[/green] songs — [bold]{len(songs_to_download)}[/bold] unique to download → [cyan]{download_dir}/[/cyan]")
         
-        if args.quiet:
-            # Quiet mode - no progress bar
-            for song in songs_to_download:
-                success, msg = download_youtube_audio(
-                    youtube_id=song.get('youtube_id', ''),
-                    artist=song.get('artist', ''),
-                    song=song.get('song', ''),
-                    channel=channel,
-                    download_dir=download_dir,
-                    format_choice=args.format,
-                    quality=args.quality,
-                    add_metadata=not args.no_metadata,
-                    redownload=args.redownload
-                )
-                
-                if success:
-                    successful += 1
-                else:
-                    failed += 1
-        else:
-            # Progress bar mode
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                console=console
-            ) as progress:
-                task = progress.add_task(
-                    f"[cyan]Downloading {args.format.upper()}...", 
-                    total=len(songs_to_download)
-                )
-                
-                for song in songs_to_download:
-                    success, msg = download_youtube_audio(
-                        youtube_id=song.get('youtube_id', ''),
-                        artist=song.get('artist', ''),
-                        song=song.get('song', ''),
-                        channel=channel,
-                        download_dir=download_dir,
-                        format_choice=args.format,
-                        quality=args.quality,
-                        add_metadata=not args.no_metadata,
-                        redownload=args.redownload,
-                        progress=progress,
-                        task_id=task
-                    )
-                    
-                    if success:
-                        successful += 1
-                    else:
-                        failed += 1
-                        console.print(f"[yellow]{msg}[/yellow]")
+        successful, failed = download_all(
+            songs_to_download, download_dir, args.format, args.quality,
+            not args.no_metadata, args.redownload, args.concurrency, quiet=args.quiet
+        )
         
         console.print(f"\n[green]✓ Download complete: {successful} successful, {failed} failed[/green]")
     
     # Display summary
     if not args.quiet:
-        display_summary(all_data, unique_data, saved_files, pages_scraped, channel)
+        display_summary(results.total_songs, results.unique_count, results.sample_tracks,
+                        saved_files, pages_scraped, channel)
 
 
 if __name__ == "__main__":